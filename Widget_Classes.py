@@ -5,10 +5,163 @@ These widgets were originally designed for use on the Bobcat Baja Team.
 """
 
 # General imports
+import collections
+import math
 from PySide6.QtWidgets import *
 from PySide6.QtGui import *
 from PySide6.QtCore import *
 
+# Colors shared by every widget
+_BLACK = QColor(0, 0, 0)
+_WHITE = QColor(255, 255, 255)
+_GREY = QColor(150, 150, 150)
+_LIGHT_GREY = QColor(200, 200, 200)
+_GREEN = QColor(0, 255, 0)
+_YELLOW = QColor(255, 255, 0)
+_RED = QColor(255, 0, 0)
+_MAGENTA = QColor(255, 0, 255)
+
+# Family name of the custom "Baja" font, set the first time _load_baja() is called
+_BAJA_FAMILY = None
+
+
+def _load_baja():
+    """!@brief Load the custom "Baja" font the first time it is needed and return its family name.
+
+    The font file is read and registered with the font database only once no matter how many widgets use it.
+    It can't be loaded at import time because the font database needs a running QApplication.
+
+    @return The family name to create "Baja" fonts with. Falls back to "Baja" if the font file could not be loaded.
+    """
+    global _BAJA_FAMILY
+    if _BAJA_FAMILY is None:
+        font_id = QFontDatabase.addApplicationFont("Fonts/Baja.ttf")
+        if font_id < 0:
+            print("ERROR LOADING Fonts/Baja.ttf")
+            _BAJA_FAMILY = "Baja"
+        else:
+            _BAJA_FAMILY = QFontDatabase.applicationFontFamilies(font_id)[0]
+    return _BAJA_FAMILY
+
+
+def _make_static_text(text, font):
+    """!@brief Create a QStaticText that is laid out once for a font and reused on every paint.
+
+    @param text The text to display.
+    @param font The font the text will be drawn with.
+    @return The prepared QStaticText.
+    """
+    static_text = QStaticText(text)
+    static_text.setPerformanceHint(QStaticText.AggressiveCaching)
+    static_text.prepare(QTransform(), font)
+    return static_text
+
+
+def _tach_unit_ticks():
+    """!@brief Compute the Tachometer tick marks for a gauge centered on (0, 0) with a size_factor of 1.
+
+    Every tick coordinate is the gauge center plus a multiple of size_factor, so these lines only need to be
+    scaled and moved to the widget's center on resize.
+
+    @return A list of QLineF tick marks.
+    """
+    gauge_size = .1  # gauge_size is .1*size_factor
+    return [
+        # Flat line ticks from the last tick (MAX VALUE) to the half way tick
+        QLineF(1 + gauge_size*.5, -1 - gauge_size*.5, 1 + gauge_size*.5, -1 + gauge_size*.5),
+        QLineF(4/5 + gauge_size*.5, -1 - gauge_size*.4, 4/5 + gauge_size*.5, -1 + gauge_size*.4),
+        QLineF(3/5 + gauge_size*.5, -1 - gauge_size*.4, 3/5 + gauge_size*.5, -1 + gauge_size*.4),
+        QLineF(2/5 + gauge_size*.5, -1 - gauge_size*.4, 2/5 + gauge_size*.5, -1 + gauge_size*.4),
+        QLineF(1/5 + gauge_size*.5, -1 - gauge_size*.4, 1/5 + gauge_size*.5, -1 + gauge_size*.4),
+        QLineF(gauge_size*.5, -1 - gauge_size*.4, gauge_size*.5, -1 + gauge_size*.4),
+
+        # Curved ticks
+        QLineF(-90/360, -330/360, -97/360, -364/360),
+        QLineF(-190/360, -288/360, -206/360, -312/360),
+        QLineF(-265/360, -216/360, -293/360, -238/360),
+        QLineF(-323/360, -122/360, -352/360, -130/360),
+
+        # First Tick (Value 0)
+        QLineF(-1 + gauge_size*.5, gauge_size*.4, -1 - gauge_size*.5, gauge_size*.4),
+    ]
+
+
+def _tach_unit_label_positions():
+    """!@brief Compute the baselines of the Tachometer tick labels for a gauge centered on (0, 0) with a size_factor of 1.
+
+    @return A list of QPointF label positions from the MAX VALUE label down to the 0 label.
+    """
+    gauge_size = .1  # gauge_size is .1*size_factor
+    return [
+        QPointF(1 - gauge_size*.3, -1 + gauge_size*1.4),
+        QPointF(3/5 - gauge_size*.3, -1 + gauge_size*1.4),
+        QPointF(1/5 - gauge_size*.3, -1 + gauge_size*1.4),
+        QPointF(-99/360 - gauge_size*.2, -330/360 + gauge_size*.9),
+        QPointF(-265/360 + gauge_size*.3, -216/360 + gauge_size*.5),
+        QPointF(-1 + gauge_size*.8, gauge_size*.5),
+    ]
+
+
+# Tachometer tick marks and label positions for a size_factor of 1, computed once when the module is imported
+_TACH_TICKS = _tach_unit_ticks()
+_TACH_LABEL_POSITIONS = _tach_unit_label_positions()
+
+# Angles of the Fuel_Gauge tick marks in degrees (Each tick is 12.5% 8 ticks total unless the max value is not 100%)
+_FUEL_TICK_ANGLES = (170, 195, 220, 245, 270, 295, 320, 345, 10)
+
+# Rotating_Image only keeps every decoded image in memory if together they take up less than this many bytes
+_PRELOAD_LIMIT = 256 * 1024 * 1024
+
+# Text for each Two-Step digit value
+_DIGITS = tuple(str(i) for i in range(10))
+
+# Variable_Section "Startup" instructions
+_STARTUP_TEXT = """HID Control Manual: 
+    The center button will pull up a menu in the bottom of the dash that can be navigated using the left and right buttons. 
+    When the option you want is in the center slot of the 3 shown press the middle/select button to change the variable section (this one).
+    For the Two-step controls use the top and bottom buttons to increment or decrement the highlighted digit and use left and right to select another digit.
+    After the values are set correctly press the middle button to set the values and ... (Return to competition widget?)
+        
+Switch Control Manual:
+    Open: Green
+    Semi: Blue
+    Locked: Red
+"""
+
+# Variable_Section message for a widget without a draw function
+_ERROR_TEXT = "ERROR WITH VARIABLE WIDGET. PLEASE HELP! :("
+
+
+class _DecodeSignals(QObject):
+    """!@brief Signals used by _DecodeJob to hand a decoded image back to the UI thread."""
+    decoded = Signal(int, QImage)
+
+
+class _DecodeJob(QRunnable):
+    """!@brief A QThreadPool job that decodes one image file off the UI thread.
+
+    The image is decoded into a QImage (QPixmap can only be created on the UI thread) and converted to
+    premultiplied ARGB32, the format the raster engine draws fastest, then sent back through a _DecodeSignals object.
+    """
+    def __init__(self, index, path, signals):
+        """!@brief Constructor for the decode job.
+        @param index The index of the image, passed back with the decoded image.
+        @param path The file path of the image to decode.
+        @param signals The _DecodeSignals object to emit the decoded image with.
+        """
+        super().__init__()
+        self.index = index
+        self.path = path
+        self.signals = signals
+
+    def run(self):
+        """!@brief Decode the image and emit it with its index."""
+        image = QImage(self.path)
+        if not image.isNull():
+            image = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+        self.signals.decoded.emit(self.index, image)
+
+
 class Warning_Light(QWidget):
     """!@brief A QWidget-based warning light that displays a PNG image when activated.
 
@@ -25,17 +178,29 @@ class Warning_Light(QWidget):
         @param width Initial width of the widget in pixels.
         """
         super().__init__(parent)
-        self.setStyleSheet("background-color: black;")
+        # Opaque widget, paintEvent fills the black background
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        self._background_brush = QBrush(_BLACK)
         self.png_path = png_path
 
         self.label = QLabel(self)
         self.label.setGeometry(0, 0, width, height)
-
-        # Load the pixmap only if the path is valid
-        if self.png_path:
-            pixmap = QPixmap(self.png_path)
-            self.label.setPixmap(pixmap)
-            self.label.setScaledContents(True)
+        self.label.setAlignment(Qt.AlignCenter)
+
+        # Load the pixmap only if the path is valid, the original is kept so resizing always scales from full quality
+        # The label is handed a pixmap that is already the right size so it never has to scale it itself
+        self._source_pixmap = QPixmap(self.png_path) if self.png_path else None
+        self._scaled_size = QSize()  # Label size the pixmap was last scaled to
+        if self._source_pixmap:
+            self.label.setPixmap(self._source_pixmap.scaled(self.label.size(),Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation))
+            self._scaled_size = self.label.size()
+
+        # Smooth rescale that runs once the widget has stopped being resized
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(50)
+        self._smooth_timer.timeout.connect(self._rescale_smooth)
 
         self.hide()  # Initially hide the widget
         
@@ -59,20 +224,42 @@ class Warning_Light(QWidget):
 
 
     
+    def paintEvent(self, event):
+        """!@brief Paint the black background behind the image label.
+        @param event The QPaintEvent that triggered the paint update.
+        """
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), self._background_brush)
+
     def resizeEvent(self, event):
         """!@brief Handle resize events and update label and pixmap accordingly.
 
         This ensures the widget fills the specified area and the pixmap is scaled
-        to fit while maintaining its aspect ratio.
+        to fit while maintaining its aspect ratio. Nothing is rescaled if the size didn't change.
 
         @param event The resize event.
         """
         super().resizeEvent(event)
         self.label.setGeometry(self.rect())  # Make the label fill the entire widget
 
-        # Resize the pixmap to fit the label while maintaining the aspect ratio
-        if self.label.pixmap():
-            self.label.setPixmap(self.label.pixmap().scaled(self.label.size(),Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation))
+        # Resize the original pixmap to fit the label while maintaining the aspect ratio
+        # A fast rescale is used while resizing and the smooth one is done after resizing stops
+        # The first resize happens when the widget is shown, the pixmap is scaled smoothly straight away for that one
+        if self._source_pixmap and self.label.size() != self._scaled_size:
+            self._scaled_size = self.label.size()
+            if event.oldSize().isValid():
+                self.label.setPixmap(self._source_pixmap.scaled(self.label.size(),Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.FastTransformation))
+                self._smooth_timer.start()
+            else:
+                self._rescale_smooth()
+
+    def _rescale_smooth(self):
+        """!@brief Rescale the original pixmap to the label with smooth filtering.
+
+        Called by a single shot timer once the widget has not been resized for a short time.
+        """
+        if self._source_pixmap:
+            self.label.setPixmap(self._source_pixmap.scaled(self.label.size(),Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation))
 
 
 
@@ -93,12 +280,36 @@ class Temp_Gauge(QWidget):
         super().__init__(parent)
         self.value = 0  # Initial temp gauge value
         self.max_value = max_value  # Maximum value of the temp gauge
-        self.setStyleSheet("background-color: black;")
+        # Tick label text for 0, 1/5, 2/5, 3/5, 4/5 and all of the max value, max_value never changes so these are built once
+        self._tick_labels = [f"{int(self.max_value * k/5)}" for k in range(5)] + [f"{self.max_value}"]
+        # Opaque widget, the black background is part of the cached static layer
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
 
         # USED IN PLACE OF OTHER 2 fonts (FONT: "Baja")
-        font_id = QFontDatabase.addApplicationFont("Fonts/Baja.ttf")
-        if font_id < 0: print("ERROR")
-        font_families = QFontDatabase.applicationFontFamilies(font_id)
+        _load_baja()
+
+        # Pens and fonts reused on every paint, sized in _resize_cache()
+        self._pen_backing = QPen(_GREY)
+        self._pen_tick = QPen(_WHITE, 5)
+        self._pen_circle = QPen(_GREEN)
+        self._pen_text = QPen(_WHITE)
+        self._tick_font = QFont(_BAJA_FAMILY)
+        self._value_font = QFont(_BAJA_FAMILY)
+        self._unit_font = QFont(_BAJA_FAMILY)
+
+        # Cached layers for the parts of the gauge that do not depend on the value
+        self._static_cache = None  # Drawn below the value indicator
+        self._overlay_cache = None  # Drawn above the value indicator
+        self._cache_size = QSize()
+        self._cache_dpr = 0.0  # Device pixel ratio the cached layers were drawn at
+        self._dirty_rect = QRect()  # Area repainted when only the value changes, set in _resize_cache()
+
+        # Coalesces repaints to at most one per frame
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self._do_update)
 
 
     def add_to_value(self, change):
@@ -108,8 +319,11 @@ class Temp_Gauge(QWidget):
         The new value wraps around if it exceeds the max value.
         """
         # Update the temp gauge value
-        self.value = (self.value + change) % (self.max_value + 1)
-        self.update()  # Request a redraw
+        new_value = (self.value + change) % (self.max_value + 1)
+        if new_value != self.value:
+            self.value = new_value
+            if not self._update_timer.isActive():
+                self._update_timer.start()  # Request a redraw of the value indicator on the next frame only if the value changed
 
     def update_value(self, new_value):
         """!@brief Update the temperature gauge value.
@@ -118,20 +332,39 @@ class Temp_Gauge(QWidget):
         The new value wraps around if it exceeds the max value.
         """
         # Update the temp gauge value
-        self.value = new_value % (self.max_value + 1)
-        self.update()  # Request a redraw
+        new_value = new_value % (self.max_value + 1)
+        if new_value != self.value:
+            self.value = new_value
+            if not self._update_timer.isActive():
+                self._update_timer.start()  # Request a redraw of the value indicator on the next frame only if the value changed
 
-    def paintEvent(self, event):
-        """!@brief Handle the paint event for rendering the gauge.
+    def _do_update(self):
+        """!@brief Redraw the value indicator once the update timer fires.
 
-        This method draws the temperature bar, gradient fill, tick marks, and text labels.
-        It also includes a circle and value/unit display. Also handles resizing.
-        
-        @param event The paint event triggered by Qt.
+        Every value change made since the last repaint is shown by this single paint.
+        """
+        self.update(self._dirty_rect)
+
+
+    def resizeEvent(self, event):
+        """!@brief Handle resize events by recomputing the gauge geometry and dropping the cached gauge layers.
+
+        The cached layers are redrawn at the new size on the next paint event.
+
+        @param event The resize event.
+        """
+        super().resizeEvent(event)
+        self._resize_cache()
+        self._static_cache = None
+        self._overlay_cache = None
+
+    def _resize_cache(self):
+        """!@brief Precompute the gauge geometry, tick marks, tick labels and fonts for the current widget size.
+
+        The tick marks are stored as QLineF objects so they can be drawn with one drawLines call and
+        the labels are stored as QStaticText objects with the top left point they are drawn at.
+        Lines, rectangles and points are kept as floating point Qt types so they are passed to QPainter as is.
         """
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
         width = self.width()
         height = self.height()
         center_x = width / 2
@@ -139,83 +372,151 @@ class Temp_Gauge(QWidget):
         size_factor = min(width, height) / 2 * 0.7
 
         bar_center_y = center_y - size_factor*.15
-        
-
-
-        # Draw the gauge (Grey backing)
         gauge_size = .1*size_factor
-        painter.setPen(QPen(QColor(150,150,150), gauge_size))
 
+        self._size_factor = size_factor
+
+        # Gauge backing, bottom of the fill and bottom circle
+        self._backing_line = QLineF(center_x, bar_center_y + size_factor, center_x, bar_center_y - size_factor)
+        self._fill_start = QPointF(center_x, bar_center_y + size_factor)
+        self._circle_rect = QRectF(center_x - gauge_size*.5, bar_center_y + size_factor*6/5, gauge_size, gauge_size)
 
-        painter.drawLine(center_x, bar_center_y + size_factor, center_x, bar_center_y - size_factor)
+        self._pen_backing.setWidthF(gauge_size)
+        self._pen_circle.setWidthF(gauge_size*4.5)
+        self._tick_font.setPointSizeF(size_factor*.05)
+        self._value_font.setPointSizeF(size_factor*.1)
+        self._unit_font.setPointSizeF(size_factor*.15)
 
         # Gauge Gradient
         self.gaugeGrad = QLinearGradient(QPointF(center_x, bar_center_y - size_factor), QPointF(center_x, bar_center_y + size_factor))
-        self.gaugeGrad.setColorAt(1, Qt.green)
-        self.gaugeGrad.setColorAt(0.2, Qt.yellow)
-        self.gaugeGrad.setColorAt(0, Qt.red)
-
-        # Draw the value indicator 
-        painter.setPen(QPen(self.gaugeGrad, gauge_size))
+        self.gaugeGrad.setColorAt(1, _GREEN)
+        self.gaugeGrad.setColorAt(0.2, _YELLOW)
+        self.gaugeGrad.setColorAt(0, _RED)
+        self._fill_pen = QPen(self.gaugeGrad, gauge_size)
+
+        # Tick marks from the last tick (MAX VALUE) down to the first tick (Value 0)
+        self._ticks = [
+            QLineF(center_x - gauge_size*.5, bar_center_y - size_factor - gauge_size*.5, center_x + gauge_size*.5, bar_center_y - size_factor - gauge_size*.5),
+            QLineF(center_x - gauge_size*.4, bar_center_y - size_factor*4/5 - gauge_size*.5, center_x + gauge_size*.4, bar_center_y - size_factor*4/5 - gauge_size*.5),
+            QLineF(center_x - gauge_size*.5, bar_center_y - size_factor*3/5 - gauge_size*.5, center_x + gauge_size*.5, bar_center_y - size_factor*3/5 - gauge_size*.5),
+            QLineF(center_x - gauge_size*.4, bar_center_y - size_factor*2/5 - gauge_size*.5, center_x + gauge_size*.4, bar_center_y - size_factor*2/5 - gauge_size*.5),
+            QLineF(center_x - gauge_size*.5, bar_center_y - size_factor*1/5 - gauge_size*.5, center_x + gauge_size*.5, bar_center_y - size_factor*1/5 - gauge_size*.5),
+            QLineF(center_x - gauge_size*.4, bar_center_y - gauge_size*.5, center_x + gauge_size*.4, bar_center_y - gauge_size*.5),
+            QLineF(center_x - gauge_size*.5, bar_center_y + size_factor*1/5 - gauge_size*.5, center_x + gauge_size*.5, bar_center_y + size_factor*1/5 - gauge_size*.5),
+            QLineF(center_x - gauge_size*.4, bar_center_y + size_factor*2/5 - gauge_size*.5, center_x + gauge_size*.4, bar_center_y + size_factor*2/5 - gauge_size*.5),
+            QLineF(center_x - gauge_size*.5, bar_center_y + size_factor*3/5 - gauge_size*.5, center_x + gauge_size*.5, bar_center_y + size_factor*3/5 - gauge_size*.5),
+            QLineF(center_x - gauge_size*.4, bar_center_y + size_factor*4/5 - gauge_size*.5, center_x + gauge_size*.4, bar_center_y + size_factor*4/5 - gauge_size*.5),
+            QLineF(center_x - gauge_size*.5, bar_center_y + size_factor*5/5 - gauge_size*.5, center_x + gauge_size*.5, bar_center_y + size_factor*5/5 - gauge_size*.5),
+        ]
+
+        # Tick labels (QStaticText is drawn from its top left corner so the baseline is moved up by the ascent)
+        ascent = QFontMetricsF(self._tick_font).ascent()
+        self._labels = [
+            (QPointF(center_x - gauge_size*2, bar_center_y - size_factor - ascent), _make_static_text(self._tick_labels[5], self._tick_font)),
+            (QPointF(center_x - gauge_size*2, bar_center_y - size_factor*3/5 - ascent), _make_static_text(self._tick_labels[4], self._tick_font)),
+            (QPointF(center_x - gauge_size*2, bar_center_y - size_factor*1/5 - ascent), _make_static_text(self._tick_labels[3], self._tick_font)),
+            (QPointF(center_x - gauge_size*2, bar_center_y + size_factor*1/5 - ascent), _make_static_text(self._tick_labels[2], self._tick_font)),
+            (QPointF(center_x - gauge_size*2, bar_center_y + size_factor*3/5 - ascent), _make_static_text(self._tick_labels[1], self._tick_font)),
+            (QPointF(center_x - gauge_size*1.3, bar_center_y + size_factor*4.9/5 - ascent), _make_static_text(self._tick_labels[0], self._tick_font)),
+        ]
+
+        ascent = QFontMetricsF(self._unit_font).ascent()
+        self._unit_label = (QPointF(center_x - gauge_size*.5 + size_factor*.15, bar_center_y - size_factor + size_factor*.1 - ascent), _make_static_text("°C", self._unit_font))
+
+        # Area that changes with the value: the gauge fill and the value display (which may reach the right edge)
+        font_metrics = QFontMetricsF(self._value_font)
+        value_x = center_x - gauge_size - size_factor*.02
+        value_baseline = bar_center_y + size_factor*6/5 + size_factor*.1
+        fill_rect = QRectF(center_x - gauge_size, bar_center_y - size_factor - gauge_size, gauge_size*2, size_factor*2 + gauge_size*2)
+        self._value_point = QPointF(value_x, value_baseline)
+        value_rect = QRectF(value_x, value_baseline - font_metrics.ascent(), width - value_x, font_metrics.height())
+        self._dirty_rect = fill_rect.united(value_rect).toAlignedRect().adjusted(-2, -2, 2, 2)
+
+    def _build_static_cache(self):
+        """!@brief Draw the parts of the gauge that do not depend on the value into cached pixmaps.
+
+        The grey backing is drawn into the layer below the value indicator. The bottom circle, tick marks,
+        labels and unit are drawn into the layer above it so they stay on top of the fill.
+        Everything white is drawn together so the pen is only changed once.
+        """
+        # Layers are drawn at device resolution so they stay sharp on scaled displays
+        dpr = self.devicePixelRatioF()
+
+        # Layer below the value indicator
+        self._static_cache = QPixmap(self.size() * dpr)
+        self._static_cache.setDevicePixelRatio(dpr)
+        self._static_cache.fill(_BLACK)
+        painter = QPainter(self._static_cache)
+        painter.setRenderHint(QPainter.Antialiasing)
 
-        # Gauge Fill to value
+        # Draw the gauge (Grey backing)
+        painter.setPen(self._pen_backing)
+        painter.drawLine(self._backing_line)
+        painter.end()
+
+        # Layer above the value indicator
+        self._overlay_cache = QPixmap(self.size() * dpr)
+        self._overlay_cache.setDevicePixelRatio(dpr)
+        self._overlay_cache.fill(Qt.transparent)
+        painter = QPainter(self._overlay_cache)
+        painter.setRenderHint(QPainter.Antialiasing)
 
-        length = (self.value / (self.max_value*.5)) * size_factor
+        # Bottom Circle
+        painter.setPen(self._pen_circle)
+        painter.drawEllipse(self._circle_rect)
 
-        if length >= 0:
-            painter.drawLine(center_x, bar_center_y + size_factor, center_x, bar_center_y + size_factor - length)
-        else:
-            None
+        # Draw the tick marks (text only uses the pen color so the labels share the tick pen)
+        painter.setPen(self._pen_tick)
+        painter.drawLines(self._ticks)
 
-        # Draw the tick marks
-        painter.setPen(QPen(QColor(255,255,255), 5))
-        Font = QFont("Baja", size_factor*.05)
-        painter.setFont(Font)
+        painter.setFont(self._tick_font)
+        for point, label in self._labels:
+            painter.drawStaticText(point, label)
 
-        # Last tick (MAX VALUE)
-        painter.drawLine(center_x - gauge_size*.5, bar_center_y - size_factor - gauge_size*.5, center_x + gauge_size*.5, bar_center_y - size_factor - gauge_size*.5)
-        painter.drawText(center_x - gauge_size*2, bar_center_y - size_factor, f"{self.max_value}")
+        # Unit Display
+        painter.setFont(self._unit_font)
+        painter.drawStaticText(*self._unit_label)
+        painter.end()
 
-        painter.drawLine(center_x - gauge_size*.4, bar_center_y - size_factor*4/5 - gauge_size*.5, center_x + gauge_size*.4, bar_center_y - size_factor*4/5 - gauge_size*.5)
+        self._cache_size = self.size()
+        self._cache_dpr = dpr
 
-        painter.drawLine(center_x - gauge_size*.5, bar_center_y - size_factor*3/5 - gauge_size*.5, center_x + gauge_size*.5, bar_center_y - size_factor*3/5 - gauge_size*.5)
-        painter.drawText(center_x - gauge_size*2, bar_center_y - size_factor*3/5, f"{int(self.max_value*4/5)}")
+    def paintEvent(self, event):
+        """!@brief Handle the paint event for rendering the gauge.
 
-        painter.drawLine(center_x - gauge_size*.4, bar_center_y - size_factor*2/5 - gauge_size*.5, center_x + gauge_size*.4, bar_center_y - size_factor*2/5 - gauge_size*.5)
+        This method draws the cached gauge layers, the gradient fill up to the current value and the value display.
+        The cached layers are rebuilt first if the widget has been resized or moved to a screen with a different scale.
+        
+        @param event The paint event triggered by Qt.
+        """
+        if self._static_cache is None or self._cache_size != self.size() or self._cache_dpr != self.devicePixelRatioF():
+            self._build_static_cache()
 
-        painter.drawLine(center_x - gauge_size*.5, bar_center_y - size_factor*1/5 - gauge_size*.5, center_x + gauge_size*.5, bar_center_y - size_factor*1/5 - gauge_size*.5)
-        painter.drawText(center_x - gauge_size*2, bar_center_y - size_factor*1/5, f"{int(self.max_value*3/5)}")
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
 
-        painter.drawLine(center_x - gauge_size*.4, bar_center_y - gauge_size*.5, center_x + gauge_size*.4, bar_center_y - gauge_size*.5)
+        fill_start = self._fill_start
 
-        painter.drawLine(center_x - gauge_size*.5, bar_center_y + size_factor*1/5 - gauge_size*.5, center_x + gauge_size*.5, bar_center_y + size_factor*1/5 - gauge_size*.5)
-        painter.drawText(center_x - gauge_size*2, bar_center_y + size_factor*1/5, f"{int(self.max_value*2/5)}")
+        painter.drawPixmap(0, 0, self._static_cache)
 
-        painter.drawLine(center_x - gauge_size*.4, bar_center_y + size_factor*2/5 - gauge_size*.5, center_x + gauge_size*.4, bar_center_y + size_factor*2/5 - gauge_size*.5)
+        # Draw the value indicator 
+        painter.setPen(self._fill_pen)
 
-        painter.drawLine(center_x - gauge_size*.5, bar_center_y + size_factor*3/5 - gauge_size*.5, center_x + gauge_size*.5, bar_center_y + size_factor*3/5 - gauge_size*.5)
-        painter.drawText(center_x - gauge_size*2, bar_center_y + size_factor*3/5, f"{int(self.max_value*1/5)}")
+        # Gauge Fill to value
 
-        painter.drawLine(center_x - gauge_size*.4, bar_center_y + size_factor*4/5 - gauge_size*.5, center_x + gauge_size*.4, bar_center_y + size_factor*4/5 - gauge_size*.5)
+        length = (self.value / (self.max_value*.5)) * self._size_factor
 
-        painter.drawLine(center_x - gauge_size*.5, bar_center_y + size_factor*5/5 - gauge_size*.5, center_x + gauge_size*.5, bar_center_y + size_factor*5/5 - gauge_size*.5)
-        painter.drawText(center_x - gauge_size*1.3, bar_center_y + size_factor*4.9/5, f"{0}")
+        if length >= 0:
+            painter.drawLine(fill_start, QPointF(fill_start.x(), fill_start.y() - length))
+        else:
+            None
 
-        # Bottom Circle
-        painter.setPen(QPen(QColor(Qt.green), gauge_size*4.5))
-        painter.drawEllipse(center_x - gauge_size*.5, bar_center_y + size_factor*6/5, gauge_size,gauge_size)
+        painter.drawPixmap(0, 0, self._overlay_cache)
 
         # Value Display
-        painter.setPen(QPen(QColor(255, 255, 255)))
-        Font = QFont("Baja", size_factor*.1)
-        painter.setFont(Font)
-        painter.drawText(center_x - gauge_size - size_factor*.02, bar_center_y + size_factor*6/5 + size_factor*.1, f"{self.value}")
-
-        # Unit Display
-        painter.setPen(QPen(QColor(255, 255, 255)))
-        Font = QFont("Baja", size_factor*.15)
-        painter.setFont(Font)
-        painter.drawText(center_x - gauge_size*.5 + size_factor*.15, bar_center_y - size_factor + size_factor*.1, f"°C")
+        painter.setPen(self._pen_text)
+        painter.setFont(self._value_font)
+        painter.drawText(self._value_point, f"{self.value}")
 
 
 
@@ -235,12 +536,34 @@ class Tachometer(QWidget):
         super().__init__(parent)
         self.value = 0  # Initial tachometer value
         self.max_value = max_value  # Maximum value of the tachometer
-        self.setStyleSheet("background-color: black;")  # Set the background to black
+        # Tick label text for 0, 1/5, 2/5, 3/5, 4/5 and all of the max value, max_value never changes so these are built once
+        self._tick_labels = [f"{int(self.max_value * k/5)}" for k in range(5)] + [f"{self.max_value}"]
+        # Opaque widget, the black background is part of the cached static layer
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
 
         # USED IN PLACE OF OTHER 2 fonts (FONT: "Baja")
-        font_id = QFontDatabase.addApplicationFont("Fonts/Baja.ttf")
-        if font_id < 0: print("ERROR")
-        font_families = QFontDatabase.applicationFontFamilies(font_id)
+        _load_baja()
+
+        # Pens and fonts reused on every paint, sized in _resize_cache()
+        self._pen_backing = QPen(_GREY)
+        self._pen_tick = QPen(_WHITE, 5)
+        self._pen_text = QPen(_WHITE)
+        self._tick_font = QFont(_BAJA_FAMILY)
+        self._value_font = QFont(_BAJA_FAMILY)
+
+        # Cached layers for the parts of the gauge that do not depend on the value
+        self._static_cache = None  # Drawn below the value indicator
+        self._overlay_cache = None  # Drawn above the value indicator
+        self._cache_size = QSize()
+        self._cache_dpr = 0.0  # Device pixel ratio the cached layers were drawn at
+        self._dirty_rect = QRect()  # Area repainted when only the value changes, set in _resize_cache()
+
+        # Coalesces repaints to at most one per frame
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self._do_update)
 
 
     def add_to_value(self, change):
@@ -250,8 +573,11 @@ class Tachometer(QWidget):
         The new value wraps around if it exceeds the max value.
         """
         # Update the tachometer value
-        self.value = (self.value + change) % (self.max_value + 1)
-        self.update()  # Request a redraw
+        new_value = (self.value + change) % (self.max_value + 1)
+        if new_value != self.value:
+            self.value = new_value
+            if not self._update_timer.isActive():
+                self._update_timer.start()  # Request a redraw of the value indicator on the next frame only if the value changed
 
     def update_value(self, new_value):
         """!@brief Update the tachometer gauge value.
@@ -260,102 +586,162 @@ class Tachometer(QWidget):
         The new value wraps around if it exceeds the max value.
         """
         # Update the tachometer value
-        self.value = new_value % (self.max_value + 1)
-        self.update()  # Request a redraw
+        new_value = new_value % (self.max_value + 1)
+        if new_value != self.value:
+            self.value = new_value
+            if not self._update_timer.isActive():
+                self._update_timer.start()  # Request a redraw of the value indicator on the next frame only if the value changed
 
-    def paintEvent(self, event):
-        """!@brief Handle the paint event for rendering the gauge.
+    def _do_update(self):
+        """!@brief Redraw the value indicator once the update timer fires.
 
-        This method draws the tachometer gauge, gradient fill, tick marks, and text labels.
-        It also includes a half-circle and strait line and value/unit display. Also handles resizing.
-        
-        @param event The paint event triggered by Qt.
+        Every value change made since the last repaint is shown by this single paint.
+        """
+        self.update(self._dirty_rect)
+
+
+    def resizeEvent(self, event):
+        """!@brief Handle resize events by recomputing the gauge geometry and dropping the cached gauge layers.
+
+        The cached layers are redrawn at the new size on the next paint event.
+
+        @param event The resize event.
+        """
+        super().resizeEvent(event)
+        self._resize_cache()
+        self._static_cache = None
+        self._overlay_cache = None
+
+    def _resize_cache(self):
+        """!@brief Precompute the gauge geometry, tick marks, tick labels and fonts for the current widget size.
+
+        The tick marks are stored as QLineF objects so they can be drawn with one drawLines call and
+        the labels are stored as QStaticText objects with the top left point they are drawn at.
+        Lines, rectangles and points are kept as floating point Qt types so they are passed to QPainter as is.
         """
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
         width = self.width()
         height = self.height()
         center_x = width / 2
         center_y = height / 2
         size_factor = min(width, height) / 2 * 0.8
-        
-
-
-        # Draw the gauge arc and line (Grey backing)
         gauge_size = .1*size_factor
-        painter.setPen(QPen(QColor(150,150,150), gauge_size))
-        start_angle = 90
-        span_angle = 90
-        arc_rect = QRect(center_x - size_factor, center_y - size_factor, 2 * size_factor, 2 * size_factor)
-        painter.drawArc(arc_rect, start_angle * 16, span_angle * 16)
 
-        painter.drawLine(center_x, center_y - size_factor, center_x + size_factor, center_y - size_factor)
+        self._size_factor = size_factor
+
+        # Arc and line sections of the gauge
+        self._arc_rect = QRectF(center_x - size_factor, center_y - size_factor, 2 * size_factor, 2 * size_factor)
+        self._line_start = QPointF(center_x, center_y - size_factor)
+        self._backing_line = QLineF(center_x, center_y - size_factor, center_x + size_factor, center_y - size_factor)
+        self._value_point = QPointF(center_x + size_factor*.4, center_y - size_factor - gauge_size*.9)
 
+        self._pen_backing.setWidthF(gauge_size)
+        self._tick_font.setPointSizeF(size_factor*.05)
+        self._value_font.setPointSizeF(size_factor*.1)
 
         # Gauge Gradient
         self.gaugeGrad = QLinearGradient(QPointF(center_x, center_y - size_factor), QPointF(center_x, center_y + size_factor))
-        self.gaugeGrad.setColorAt(0, Qt.green)
-        self.gaugeGrad.setColorAt(0.8, Qt.yellow)
-        self.gaugeGrad.setColorAt(1, Qt.red)
+        self.gaugeGrad.setColorAt(0, _GREEN)
+        self.gaugeGrad.setColorAt(0.8, _YELLOW)
+        self.gaugeGrad.setColorAt(1, _RED)
+        self._fill_pen = QPen(self.gaugeGrad, gauge_size)
+
+        # Scale the precomputed tick marks by size_factor and move them to the center of the widget
+        transform = QTransform(size_factor, 0, 0, size_factor, center_x, center_y)
+        self._ticks = [transform.map(tick) for tick in _TACH_TICKS]
+
+        # Tick labels placed with the same transform (QStaticText is drawn from its top left corner so the baseline is moved up by the ascent)
+        ascent = QPointF(0, QFontMetricsF(self._tick_font).ascent())
+        self._labels = [(transform.map(position) - ascent, _make_static_text(text, self._tick_font)) for position, text in zip(_TACH_LABEL_POSITIONS, reversed(self._tick_labels))]
+
+        # Area that changes with the value: the arc and line fill and the value display (which may reach the right edge)
+        font_metrics = QFontMetricsF(self._value_font)
+        value_x = center_x + size_factor*.4
+        value_baseline = center_y - size_factor - gauge_size*.9
+        fill_rect = QRectF(center_x - size_factor - gauge_size, center_y - size_factor - gauge_size, size_factor*2 + gauge_size*2, size_factor + gauge_size*2)
+        value_rect = QRectF(value_x, value_baseline - font_metrics.ascent(), width - value_x, font_metrics.height())
+        self._dirty_rect = fill_rect.united(value_rect).toAlignedRect().adjusted(-2, -2, 2, 2)
+
+    def _build_static_cache(self):
+        """!@brief Draw the parts of the gauge that do not depend on the value into cached pixmaps.
+
+        The grey arc and line backing are drawn into the layer below the value indicator.
+        The tick marks and their labels are drawn into the layer above it so they stay on top of the fill.
+        """
+        # Layers are drawn at device resolution so they stay sharp on scaled displays
+        dpr = self.devicePixelRatioF()
+
+        # Layer below the value indicator
+        self._static_cache = QPixmap(self.size() * dpr)
+        self._static_cache.setDevicePixelRatio(dpr)
+        self._static_cache.fill(_BLACK)
+        painter = QPainter(self._static_cache)
+        painter.setRenderHint(QPainter.Antialiasing)
 
-        # Draw the value indicator 
-        painter.setPen(QPen(self.gaugeGrad, gauge_size))
+        # Draw the gauge arc and line (Grey backing)
+        painter.setPen(self._pen_backing)
+        start_angle = 90
+        span_angle = 90
+        painter.drawArc(self._arc_rect, start_angle * 16, span_angle * 16)
 
-        # Arc section of Gauge Fill to value
-        arc_start = 180
-        arc_value = -1 * ((self.value / (self.max_value*.5)) * 90)
-        if arc_value < -90:
-            painter.drawArc(arc_rect, arc_start * 16, -90 * 16)
-        else:
-            painter.drawArc(arc_rect, arc_start * 16, arc_value * 16)
+        painter.drawLine(self._backing_line)
+        painter.end()
 
-        # Line section of Gauge Fill to value
+        # Layer above the value indicator
+        self._overlay_cache = QPixmap(self.size() * dpr)
+        self._overlay_cache.setDevicePixelRatio(dpr)
+        self._overlay_cache.fill(Qt.transparent)
+        painter = QPainter(self._overlay_cache)
+        painter.setRenderHint(QPainter.Antialiasing)
 
-        if self.value > self.max_value*.5:
-            length = (self.value - self.max_value*.5) / (self.max_value*.5) * size_factor
-            painter.drawLine(center_x, center_y - size_factor, center_x + length, center_y - size_factor)
+        # Draw the tick marks
+        painter.setPen(self._pen_tick)
+        painter.drawLines(self._ticks)
 
+        painter.setFont(self._tick_font)
+        for point, label in self._labels:
+            painter.drawStaticText(point, label)
+        painter.end()
 
-        # Draw the tick marks
-        painter.setPen(QPen(QColor(255,255,255), 5))
-        Font = QFont("Baja", size_factor*.05)
-        painter.setFont(Font)
+        self._cache_size = self.size()
+        self._cache_dpr = dpr
 
-        # Flat line ticks
+    def paintEvent(self, event):
+        """!@brief Handle the paint event for rendering the gauge.
 
-        # Last tick (MAX VALUE)
-        painter.drawLine(center_x + size_factor + gauge_size*.5, center_y - size_factor - gauge_size*.5, center_x + size_factor + gauge_size*.5, center_y - size_factor + gauge_size*.5)
-        painter.drawText(center_x + size_factor - gauge_size*.3, center_y - size_factor + gauge_size*1.4, f"{self.max_value}")
+        This method draws the cached gauge layers, the gradient fill up to the current value and the value/unit display.
+        The cached layers are rebuilt first if the widget has been resized or moved to a screen with a different scale.
+        
+        @param event The paint event triggered by Qt.
+        """
+        if self._static_cache is None or self._cache_size != self.size() or self._cache_dpr != self.devicePixelRatioF():
+            self._build_static_cache()
 
-        painter.drawLine(center_x + size_factor*4/5 + gauge_size*.5, center_y - size_factor - gauge_size*.4, center_x + size_factor*4/5 + gauge_size*.5, center_y - size_factor + gauge_size*.4)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
 
-        painter.drawLine(center_x + size_factor*3/5 + gauge_size*.5, center_y - size_factor - gauge_size*.4, center_x + size_factor*3/5 + gauge_size*.5, center_y - size_factor + gauge_size*.4)
-        painter.drawText(center_x + size_factor*3/5 - gauge_size*.3, center_y - size_factor + gauge_size*1.4, f"{int(self.max_value * 4/5)}")
+        arc_rect = self._arc_rect
+        line_start = self._line_start
 
-        painter.drawLine(center_x + size_factor*2/5 + gauge_size*.5, center_y - size_factor - gauge_size*.4, center_x + size_factor*2/5 + gauge_size*.5, center_y - size_factor + gauge_size*.4)
+        painter.drawPixmap(0, 0, self._static_cache)
 
-        painter.drawLine(center_x + size_factor*1/5 + gauge_size*.5, center_y - size_factor - gauge_size*.4, center_x + size_factor*1/5 + gauge_size*.5, center_y - size_factor + gauge_size*.4)
-        painter.drawText(center_x + size_factor*1/5 - gauge_size*.3, center_y - size_factor + gauge_size*1.4, f"{int(self.max_value * 3/5)}")
-        
-        # Half way tick
-        painter.drawLine(center_x + gauge_size*.5, center_y - size_factor - gauge_size*.4, center_x + gauge_size*.5, center_y - size_factor + gauge_size*.4)
+        # Draw the value indicator 
+        painter.setPen(self._fill_pen)
 
-        # Curved ticks
+        # Arc section of Gauge Fill to value
+        arc_start = 180
+        arc_value = -1 * ((self.value / (self.max_value*.5)) * 90)
+        if arc_value < -90:
+            painter.drawArc(arc_rect, arc_start * 16, -90 * 16)
+        else:
+            painter.drawArc(arc_rect, arc_start * 16, int(arc_value * 16))
 
-        painter.drawLine(center_x - size_factor*90/360, center_y - size_factor*330/360, center_x - size_factor*97/360, center_y - size_factor*364/360)
-        painter.drawText(center_x - size_factor*99/360 - gauge_size*.2, center_y - size_factor*330/360 + gauge_size*.9, f"{int(self.max_value * 2/5)}")
-        
-        painter.drawLine(center_x - size_factor*190/360, center_y - size_factor*288/360, center_x - size_factor*206/360, center_y - size_factor*312/360)
-        
-        painter.drawLine(center_x - size_factor*265/360, center_y - size_factor*216/360, center_x - size_factor*293/360, center_y - size_factor*238/360)
-        painter.drawText(center_x - size_factor*265/360 + gauge_size*.3, center_y - size_factor*216/360 + gauge_size*.5, f"{int(self.max_value * 1/5)}")
+        # Line section of Gauge Fill to value
 
-        painter.drawLine(center_x - size_factor*323/360, center_y - size_factor*122/360, center_x - size_factor*352/360, center_y - size_factor*130/360)
+        if self.value > self.max_value*.5:
+            length = (self.value - self.max_value*.5) / (self.max_value*.5) * self._size_factor
+            painter.drawLine(line_start, QPointF(line_start.x() + length, line_start.y()))
 
-        # First Tick (Value 0)
-        painter.drawLine(center_x - size_factor + gauge_size*.5, center_y + gauge_size*.4, center_x - size_factor - gauge_size*.5, center_y + gauge_size*.4)
-        painter.drawText(center_x - size_factor + gauge_size*.8, center_y + gauge_size*.5, f"{0}")
+        painter.drawPixmap(0, 0, self._overlay_cache)
 
         # Draw the value text
         # painter.setPen(QPen(QColor(255, 255, 255)))
@@ -366,10 +752,9 @@ class Tachometer(QWidget):
         # painter.setFont(Font)
         # painter.drawText(center_x + size_factor*.8, center_y - size_factor - gauge_size*.9, f"{"RPM"}")
 
-        painter.setPen(QPen(QColor(255, 255, 255)))
-        Font = QFont("Baja", size_factor*.1)
-        painter.setFont(Font)
-        painter.drawText(center_x + size_factor*.4, center_y - size_factor - gauge_size*.9, f"{self.value} RPM")
+        painter.setPen(self._pen_text)
+        painter.setFont(self._value_font)
+        painter.drawText(self._value_point, f"{self.value} RPM")
              
 
 class Fuel_Gauge(QWidget):
@@ -388,12 +773,37 @@ class Fuel_Gauge(QWidget):
         super().__init__(parent)
         self.value = 0  # Initial Fuel Gauge value
         self.max_value = max_value  # Maximum value of the Fuel Gauge
-        self.setStyleSheet("background-color: black;")  # Set the background to black
+        # Opaque widget, the black background is part of the cached static layer
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
 
         # USED IN PLACE OF OTHER 2 fonts (FONT: "Baja")
-        font_id = QFontDatabase.addApplicationFont("Fonts/Baja.ttf")
-        if font_id < 0: print("ERROR")
-        font_families = QFontDatabase.applicationFontFamilies(font_id)
+        _load_baja()
+
+        # Pens and fonts reused on every paint, fonts are sized in _resize_cache()
+        self._pen_backing = QPen(_GREY, 15)
+        self._pen_high = QPen(_GREEN, 15)
+        self._pen_medium = QPen(_YELLOW, 15)
+        self._pen_low = QPen(_RED, 15)
+        self._pen_invalid = QPen(_MAGENTA, 15)
+        self._pen_tick = QPen(_WHITE, 15)
+        self._pen_tick.setCapStyle(Qt.FlatCap)  # Ticks are radial lines exactly as long as the arc is wide
+        self._pen_text = QPen(_WHITE)
+        self._label_font = QFont(_BAJA_FAMILY)
+        self._value_font = QFont(_BAJA_FAMILY)
+
+        # Cached layers for the parts of the gauge that do not depend on the value
+        self._static_cache = None  # Drawn below the value indicator
+        self._overlay_cache = None  # Drawn above the value indicator
+        self._cache_size = QSize()
+        self._cache_dpr = 0.0  # Device pixel ratio the cached layers were drawn at
+        self._dirty_rect = QRect()  # Area repainted when only the value changes, set in _resize_cache()
+
+        # Coalesces repaints to at most one per frame
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self._do_update)
 
 
     def add_to_value(self, change):
@@ -403,8 +813,11 @@ class Fuel_Gauge(QWidget):
         The new value wraps around if it exceeds the max value.
         """
         # Update the Fuel Gauge value
-        self.value = (self.value + change) % (self.max_value + 1)
-        self.update()  # Request a redraw
+        new_value = (self.value + change) % (self.max_value + 1)
+        if new_value != self.value:
+            self.value = new_value
+            if not self._update_timer.isActive():
+                self._update_timer.start()  # Request a redraw of the value indicator on the next frame only if the value changed
 
     def update_value(self, new_value):
         """!@brief Update the tachometer gauge value.
@@ -413,90 +826,160 @@ class Fuel_Gauge(QWidget):
         The new value wraps around if it exceeds the max value.
         """
         # Update the Fuel Gauge value
-        self.value = new_value % (self.max_value + 1)
-        self.update()  # Request a redraw
+        new_value = new_value % (self.max_value + 1)
+        if new_value != self.value:
+            self.value = new_value
+            if not self._update_timer.isActive():
+                self._update_timer.start()  # Request a redraw of the value indicator on the next frame only if the value changed
 
+    def _do_update(self):
+        """!@brief Redraw the value indicator once the update timer fires.
 
-    def paintEvent(self, event):
-        """!@brief Handle the paint event for rendering the gauge.
+        Every value change made since the last repaint is shown by this single paint.
+        """
+        self.update(self._dirty_rect)
 
-        This method draws the fuel gauge, gradient fill, tick marks, and text labels.
-        It also includes a half-circle and and value/unit display. Also handles resizing.
-        
-        @param event The paint event triggered by Qt.
+
+    def resizeEvent(self, event):
+        """!@brief Handle resize events by recomputing the gauge geometry and dropping the cached gauge layers.
+
+        The cached layers are redrawn at the new size on the next paint event.
+
+        @param event The resize event.
+        """
+        super().resizeEvent(event)
+        self._resize_cache()
+        self._static_cache = None
+        self._overlay_cache = None
+
+    def _resize_cache(self):
+        """!@brief Precompute the gauge geometry, tick marks, the E/F labels and fonts for the current widget size.
+
+        The labels are stored as QStaticText objects with the top left point they are drawn at.
+        Lines, rectangles and points are kept as floating point Qt types so they are passed to QPainter as is.
         """
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
         width = self.width()
         height = self.height()
         center_x = width / 2
         center_y = height / 2
         size_factor = min(width, height) / 2 * 0.8
 
+        self._arc_rect = QRectF(center_x - size_factor, center_y - size_factor, 2 * size_factor, 2 * size_factor)
+
+        self._label_font.setPointSizeF(size_factor*.2)
+        self._value_font.setPointSizeF(size_factor*.25)
+
+        # Tick marks are short radial lines across the 15 pixel wide arc
+        inner = size_factor - 7.5
+        outer = size_factor + 7.5
+        self._ticks = []
+        for angle in _FUEL_TICK_ANGLES:
+            cos_a = math.cos(math.radians(angle))
+            sin_a = math.sin(math.radians(angle))
+            self._ticks.append(QLineF(center_x + inner*cos_a, center_y - inner*sin_a, center_x + outer*cos_a, center_y - outer*sin_a))
+
+        # E and F labels (QStaticText is drawn from its top left corner so the baseline is moved up by the ascent)
+        ascent = QFontMetricsF(self._label_font).ascent()
+        self._labels = [
+            (QPointF(center_x - size_factor*320/360, center_y - size_factor*10/360 - ascent), _make_static_text("E", self._label_font)),
+            (QPointF(center_x - size_factor*-280/360, center_y - size_factor*10/360 - ascent), _make_static_text("F", self._label_font)),
+        ]
+
+        # Area that changes with the value: the arc fill and the percentage display (which may reach the right edge)
+        font_metrics = QFontMetricsF(self._value_font)
+        value_x = center_x - size_factor*90/360
+        value_baseline = center_y + size_factor*180/360
+        fill_rect = QRectF(center_x - size_factor - 15, center_y - size_factor - 15, size_factor*2 + 30, size_factor*2 + 30)
+        self._value_point = QPointF(value_x, value_baseline)
+        value_rect = QRectF(value_x, value_baseline - font_metrics.ascent(), width - value_x, font_metrics.height())
+        self._dirty_rect = fill_rect.united(value_rect).toAlignedRect().adjusted(-2, -2, 2, 2)
+
+    def _build_static_cache(self):
+        """!@brief Draw the parts of the gauge that do not depend on the value into cached pixmaps.
+
+        The grey arc is drawn into the layer below the value indicator.
+        The tick marks and the E/F labels are drawn into the layer above it so they stay on top of the fill.
+        """
+        # Layers are drawn at device resolution so they stay sharp on scaled displays
+        dpr = self.devicePixelRatioF()
+
+        # Layer below the value indicator
+        self._static_cache = QPixmap(self.size() * dpr)
+        self._static_cache.setDevicePixelRatio(dpr)
+        self._static_cache.fill(_BLACK)
+        painter = QPainter(self._static_cache)
+        painter.setRenderHint(QPainter.Antialiasing)
+
         # Draw the gauge arc
         start_angle = 170
         span_angle = 200
-        painter.setPen(QPen(QColor(150, 150, 150), 15))
-        painter.drawArc(center_x - size_factor, center_y - size_factor, 2 * size_factor, 2 * size_factor, start_angle * 16, span_angle * 16)
-
-        # Draw the value indicator
-        if self.value >= self.max_value*.4:
-            painter.setPen(QPen(QColor(0, 255, 0), 15))
-        elif self.value >= self.max_value*.2:
-            painter.setPen(QPen(QColor(255, 255, 0), 15))
-        elif self.value >= 0:
-            painter.setPen(QPen(QColor(255, 0, 0), 15))
-        else:
-            painter.setPen(QPen(QColor(255, 0, 255), 15))
-
-        arc_rect = QRect(center_x - size_factor, center_y - size_factor, 2 * size_factor, 2 * size_factor)
-
-        arc_start = 170 # -370 deg
-        arc_value = ((self.value / (self.max_value)) * 200)
-        painter.drawArc(arc_rect, arc_start * 16, arc_value * 16)
-
+        painter.setPen(self._pen_backing)
+        painter.drawArc(self._arc_rect, start_angle * 16, span_angle * 16)
+        painter.end()
+
+        # Layer above the value indicator
+        self._overlay_cache = QPixmap(self.size() * dpr)
+        self._overlay_cache.setDevicePixelRatio(dpr)
+        self._overlay_cache.fill(Qt.transparent)
+        painter = QPainter(self._overlay_cache)
+        painter.setRenderHint(QPainter.Antialiasing)
 
         # Draw Tick marks (Each tick is 12.5% 8 ticks total unless the max value is not 100%)
-        painter.setPen(QPen(QColor(255,255,255), 15))
-        Font = QFont("Baja", size_factor*.2)
-        painter.setFont(Font)
-        
-        painter.drawArc(arc_rect, 170*16, 1)
-        painter.drawText(center_x - size_factor*320/360, center_y - size_factor*10/360, f"E")
+        painter.setPen(self._pen_tick)
+        painter.drawLines(self._ticks)
 
-        painter.drawArc(arc_rect, 195*16, 1)
+        painter.setFont(self._label_font)
+        for point, label in self._labels:
+            painter.drawStaticText(point, label)
+        painter.end()
 
-        painter.drawArc(arc_rect, 220*16, 1)
+        self._cache_size = self.size()
+        self._cache_dpr = dpr
 
-        painter.drawArc(arc_rect, 245*16, 1)
+    def paintEvent(self, event):
+        """!@brief Handle the paint event for rendering the gauge.
 
-        painter.drawArc(arc_rect, 270*16, 1)
+        This method draws the cached gauge layers, the color-coded arc up to the current value and the percentage display.
+        The cached layers are rebuilt first if the widget has been resized or moved to a screen with a different scale.
+        
+        @param event The paint event triggered by Qt.
+        """
+        if self._static_cache is None or self._cache_size != self.size() or self._cache_dpr != self.devicePixelRatioF():
+            self._build_static_cache()
 
-        painter.drawArc(arc_rect, 295*16, 1)
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
 
-        painter.drawArc(arc_rect, 320*16, 1)
+        painter.drawPixmap(0, 0, self._static_cache)
 
-        painter.drawArc(arc_rect, 345*16, 1)
-    
-        painter.drawArc(arc_rect, 10*16, 1)
+        # Draw the value indicator
+        if self.value >= self.max_value*.4:
+            painter.setPen(self._pen_high)
+        elif self.value >= self.max_value*.2:
+            painter.setPen(self._pen_medium)
+        elif self.value >= 0:
+            painter.setPen(self._pen_low)
+        else:
+            painter.setPen(self._pen_invalid)
 
-        painter.drawText(center_x - size_factor*-280/360, center_y - size_factor*10/360, f"F")
+        arc_start = 170 # -370 deg
+        arc_value = ((self.value / (self.max_value)) * 200)
+        painter.drawArc(self._arc_rect, arc_start * 16, int(arc_value * 16))
 
+        painter.drawPixmap(0, 0, self._overlay_cache)
 
         # FOR IF FUEL IS NOT TO BE PRINTED
-        painter.setPen(QPen(QColor(255, 255, 255)))
-        Font = QFont("Baja", size_factor*.25)
-        painter.setFont(Font)
-        painter.drawText(center_x - size_factor*90/360, center_y + size_factor*180/360, f"{int(self.value)}%")
+        painter.setPen(self._pen_text)
+        painter.setFont(self._value_font)
+        painter.drawText(self._value_point, f"{int(self.value)}%")
 
 
 class Speedometer(QWidget):
     """!@brief A QWidget-based speedometer that visually displays a numerical speed value in MPH.
 
     This widget presents a digital-style speedometer readout. The speed value is updated dynamically
-    and rendered in a custom font, centered on the widget. The display adapts its text alignment
-    based on the number of digits in the speed.
+    and rendered in a custom font, centered on the widget. The speed is right aligned against the
+    MPH label so the display adapts to the number of digits in the speed.
     """
     def __init__(self, parent=None, max_value=200):
         """!@brief Constructor for the Speedometer widget.
@@ -507,12 +990,24 @@ class Speedometer(QWidget):
 
         self.value = 0  # Initial speedometer value
         self.max_value = max_value  # Maximum value of the speedometer
-        self.setStyleSheet("background-color: black;")
+        # Opaque widget, paintEvent fills the black background
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        self._background_brush = QBrush(_BLACK)
 
         # USED IN PLACE OF OTHER 2 fonts (FONT: "Baja")
-        font_id = QFontDatabase.addApplicationFont("Fonts/Baja.ttf")
-        if font_id < 0: print("ERROR")
-        font_families = QFontDatabase.applicationFontFamilies(font_id)
+        _load_baja()
+
+        # Pen and font reused on every paint, the font is sized in resizeEvent
+        self._pen_text = QPen(_WHITE)
+        self._font = QFont(_BAJA_FAMILY)
+        self._value_static = {}  # Prepared QStaticText for each speed that has been shown at the current size
+
+        # Coalesces repaints to at most one per frame
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self._do_update)
 
 
     def add_to_value(self, change):
@@ -520,8 +1015,11 @@ class Speedometer(QWidget):
         @param change The amount to adjust the current speed by. Wraps around on overflow.
         """
         # Update the speedometer value
-        self.value = (self.value + change) % (self.max_value + 1)
-        self.update()  # Request a redraw
+        new_value = (self.value + change) % (self.max_value + 1)
+        if new_value != self.value:
+            self.value = new_value
+            if not self._update_timer.isActive():
+                self._update_timer.start()  # Request a redraw on the next frame only if the value changed
 
     def update_value(self, new_value):
         """!@brief Update the speedometer gauge value.
@@ -530,8 +1028,41 @@ class Speedometer(QWidget):
         The new value wraps around if it exceeds the max value.
         """
         # Update the speedometer value
-        self.value = new_value % (self.max_value + 1)
-        self.update()  # Request a redraw
+        new_value = new_value % (self.max_value + 1)
+        if new_value != self.value:
+            self.value = new_value
+            if not self._update_timer.isActive():
+                self._update_timer.start()  # Request a redraw on the next frame only if the value changed
+
+    def _do_update(self):
+        """!@brief Redraw the widget once the update timer fires.
+
+        Every change made since the last repaint is shown by this single paint.
+        """
+        self.update()
+
+    def resizeEvent(self, event):
+        """!@brief Handle resize events by resizing the font and recomputing the text positions.
+        @param event The resize event.
+        """
+        super().resizeEvent(event)
+
+        width = self.width()
+        height = self.height()
+        center_x = width / 2
+        center_y = height / 2
+        size_factor = min(width, height) / 2
+
+        self._font.setPointSizeF(size_factor*.25)
+        font_metrics = QFontMetricsF(self._font)
+
+        # QStaticText is drawn from its top left corner so the baseline is moved up by the ascent
+        self._text_top = center_y + size_factor*.25 - font_metrics.ascent()
+        self._mph_static = (QPointF(center_x - size_factor*.5 + size_factor*.75, self._text_top), _make_static_text("MPH", self._font))
+
+        # The speed ends one space before the MPH label
+        self._value_right = center_x + size_factor*.25 - font_metrics.horizontalAdvance(" ")
+        self._value_static = {}
 
     def paintEvent(self, event):
         """!@brief Handle the paint event for rendering the speedometer.
@@ -542,26 +1073,22 @@ class Speedometer(QWidget):
         """
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-        
-        width = self.width()
-        height = self.height()
-        center_x = width / 2
-        center_y = height / 2
-        size_factor = min(width, height) / 2
-        
+        painter.fillRect(event.rect(), self._background_brush)
 
-        painter.setPen(QPen(QColor(255, 255, 255)))
-        Font = QFont("Baja", size_factor*.25)
-        painter.setFont(Font)
+        painter.setPen(self._pen_text)
+        painter.setFont(self._font)
 
-        if self.value >= 100:
-            painter.drawText(center_x - size_factor*.5, center_y + size_factor*.25, f"{self.value}")
-        elif self.value >= 10:
-            painter.drawText(center_x - size_factor*.25, center_y + size_factor*.25, f"{self.value}")
-        else:
-            painter.drawText(center_x, center_y + size_factor*.25, f"{self.value}")
+        # Look up the laid out text for this speed, only laying it out the first time it is shown
+        value_static = self._value_static.get(self.value)
+        if value_static is None:
+            if len(self._value_static) > self.max_value:
+                self._value_static.clear()
+            value_static = _make_static_text(f"{self.value}", self._font)
+            self._value_static[self.value] = value_static
 
-        painter.drawText(center_x - size_factor*.5 + size_factor*.75, center_y + size_factor*.25, f"MPH")
+        painter.drawStaticText(QPointF(self._value_right - value_static.size().width(), self._text_top), value_static)
+
+        painter.drawStaticText(*self._mph_static)
 
 
 class Menu(QWidget):
@@ -581,60 +1108,112 @@ class Menu(QWidget):
         # LAP TIME MIGHT NOT BE A VARIABLE SECTION AFTER COMPLETION ITEM COULD BE ALWAYS ACTIVE
         self.modes = modes
         self.num_of_modes = len(self.modes)
-        self.state = "Startup" # Initial Menu value
+        # Index of the current mode in self.modes, starts at "Startup" (Initial Menu value)
+        self._idx = self.modes.index("Startup") if "Startup" in self.modes else 0
 
-        self.setStyleSheet("background-color: black;")
+        # Opaque widget, paintEvent fills the black background
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        self._background_brush = QBrush(_BLACK)
 
         # USED IN PLACE OF OTHER 2 fonts (FONT: "Baja")
-        font_id = QFontDatabase.addApplicationFont("Fonts/Baja.ttf")
-        if font_id < 0: print("ERROR")
-        font_families = QFontDatabase.applicationFontFamilies(font_id)
-
+        _load_baja()
+
+        # Pen and brush reused on every paint
+        self._pen_text = QPen(_BLACK, 10)
+        self._menu_brush = QBrush(_WHITE)
+
+        # Text for every mode, laid out once with the menu font in resizeEvent
+        self._mode_static = []
+        for mode in self.modes:
+            static_text = QStaticText(f"{mode}")
+            static_text.setPerformanceHint(QStaticText.AggressiveCaching)
+            self._mode_static.append(static_text)
+
+        # Coalesces repaints to at most one per frame
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(16)
+        self._update_timer.timeout.connect(self._do_update)
+
+
+    @property
+    def state(self):
+        """!@brief The name of the currently selected mode."""
+        return self.modes[self._idx]
+
+    @state.setter
+    def state(self, new_state):
+        """!@brief Select a mode by name.
+        @param new_state The name of the mode to select, must be in the modes list.
+        """
+        self._idx = self.modes.index(new_state)
+        if not self._update_timer.isActive():
+            self._update_timer.start()  # Request a redraw on the next frame
 
     def update_value(self, move_value):
         """!@brief Updates the currently selected menu state.
-        @param move_value The number of steps to move in the modes list (positive or negative).
+        @param move_value The number of steps to move in the modes list (positive or negative). Wraps around at either end.
         """
         # Change the menu's mode
-        if (self.modes.index(self.state) + move_value) < self.num_of_modes:
-            self.state = self.modes[self.modes.index(self.state) + move_value]
-        else:
-            self.state = self.modes[0]
+        new_idx = (self._idx + move_value) % self.num_of_modes
 
-        self.update()  # Request a redraw
+        if new_idx != self._idx:
+            self._idx = new_idx
+            if not self._update_timer.isActive():
+                self._update_timer.start()  # Request a redraw on the next frame only if the mode changed
 
+    def _do_update(self):
+        """!@brief Redraw the widget once the update timer fires.
 
-    def paintEvent(self, event):
-        """!@brief Paint event handler that draws the menu bar and its current state.
-        @param event The QPaintEvent that triggered the paint update.
+        Every change made since the last repaint is shown by this single paint.
         """
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setPen(QPen(QColor(0, 0, 0), 10))
+        self.update()
+
+    def resizeEvent(self, event):
+        """!@brief Handle resize events by recomputing the menu bar rectangles and font and laying out the mode names.
+        @param event The resize event.
+        """
+        super().resizeEvent(event)
 
         width = self.width()
         height = self.height()
-        center_x = width / 2
-        center_y = 14/15*height / 2 # Half way in the rectangle of the menu not the center of the window
         size_factor = min(width, height) / 2 * 0.8
 
-        menu_background = QRect(0, 14/15*height, width, height/15)
-        painter.fillRect(menu_background, QBrush(QColor(255, 255, 255)))
+        self._menu_background = QRectF(0, 14/15*height, width, height/15)
+        self._left_item = QRectF(0, 14/15*height, width/3, height/15)
+        self._selected_item = QRectF(width/3, 14/15*height, width/3, height/15)
+        self._right_item = QRectF(width*2/3, 14/15*height, width/3, height/15)
+        self._font = QFont("Sans Serif", max(1, int(size_factor/10)), QFont.Bold)
 
+        # Centers the mode names are drawn around
+        self._left_center = self._left_item.center()
+        self._selected_center = self._selected_item.center()
+        self._right_center = self._right_item.center()
 
-        left_item = QRect(0, 14/15*height, width/3, height/15)
-        selected_item = QRect(width/3, 14/15*height, width/3, height/15)
-        right_item = QRect(width*2/3, 14/15*height, width/3, height/15)
+        for static_text in self._mode_static:
+            static_text.prepare(QTransform(), self._font)
 
-        painter.setFont(QFont("Sans Sariff", size_factor/10, QFont.Bold))
-        painter.drawText(selected_item, Qt.AlignCenter, f"{self.state}")
 
-        painter.drawText(left_item, Qt.AlignCenter, f"{self.modes[self.modes.index(self.state) - 1]}")
+    def paintEvent(self, event):
+        """!@brief Paint event handler that draws the menu bar and its current state.
+        @param event The QPaintEvent that triggered the paint update.
+        """
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(event.rect(), self._background_brush)
+        painter.setPen(self._pen_text)
 
-        if (self.modes.index(self.state) + 1) < self.num_of_modes:
-            painter.drawText(right_item, Qt.AlignCenter, f"{self.modes[self.modes.index(self.state) + 1]}")
-        else:
-            painter.drawText(right_item, Qt.AlignCenter, f"{self.modes[0]}")
+        painter.fillRect(self._menu_background, self._menu_brush)
+
+        # Current, previous and next modes (wrapping around the ends of the list) centered in their items
+        painter.setFont(self._font)
+        for center, idx in ((self._selected_center, self._idx),
+                            (self._left_center, (self._idx - 1) % self.num_of_modes),
+                            (self._right_center, (self._idx + 1) % self.num_of_modes)):
+            static_text = self._mode_static[idx]
+            text_size = static_text.size()
+            painter.drawStaticText(QPointF(center.x() - text_size.width()/2, center.y() - text_size.height()/2), static_text)
 
 
 
@@ -655,54 +1234,165 @@ class Rotating_Image(QWidget):
         @param image_time The length of time in milliseconds that a image is displayed before it changes.
         """
         super().__init__(parent)
-        self.setStyleSheet("background-color: black;")
+        # Opaque widget, paintEvent fills the black background
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        self._background_brush = QBrush(_BLACK)
         self.png_paths = png_paths
         self.num_of_paths = len(png_paths)
         self.current_path = 0
+        self._shown_image = 0  # Index of the image being displayed, stays on the last valid image if a path is empty
 
         self.timer = QTimer(self)
         self.timer.timeout.connect(self.change_image)
-        self.timer.start(image_time)
-
-        self.label = QLabel(self)
-        self.label.setGeometry(0, 0, width, height)
+        if self.num_of_paths > 0:
+            self.timer.start(image_time)  # Nothing to rotate through without images
+
+        # Load every pixmap once (only if the path is valid) so changing images doesn't read from disk.
+        # The images are decoded in the background, an image that is needed before it is done is loaded straight away.
+        # If the decoded images would use too much memory they are loaded from disk when they have to be scaled instead.
+        estimated_bytes = 0
+        for path in self.png_paths:
+            if path:
+                image_size = QImageReader(path).size()
+                estimated_bytes += max(image_size.width(), 0) * max(image_size.height(), 0) * 4
+        self._preload = estimated_bytes <= _PRELOAD_LIMIT
+        self._source_pixmaps = [None] * self.num_of_paths
+        if self._preload:
+            self._decode_signals = _DecodeSignals()
+            self._decode_signals.decoded.connect(self._on_decoded, Qt.QueuedConnection)
+            for i, path in enumerate(self.png_paths):
+                if path:
+                    QThreadPool.globalInstance().start(_DecodeJob(i, path, self._decode_signals))
+
+        # Least recently used copies of the pixmaps scaled to the widget, keyed by (index, width, height)
+        self._scaled_cache = collections.OrderedDict()
+        self._scaled_cache_max = max(2*self.num_of_paths, 1)
+
+        # While the widget is being resized the last scaled image is stretched by the painter, the smooth rescale runs once resizing stops
+        self._resizing = False
+        self._last_scaled = None  # (index, QPixmap) of the last image painted at its exact size
+        self._resample_timer = QTimer(self)
+        self._resample_timer.setSingleShot(True)
+        self._resample_timer.setInterval(100)
+        self._resample_timer.timeout.connect(self._resample_smooth)
+
+        self.resize(width, height)
 
-        # Load the pixmap only if the path is valid
-        if self.png_paths[self.current_path]:
-            pixmap = QPixmap(self.png_paths[self.current_path])
-            self.label.setPixmap(pixmap)
-            self.label.setScaledContents(True)
 
 
+    def paintEvent(self, event):
+        """!@brief Paint the black background and the current image centered on the widget.
+        @param event The QPaintEvent that triggered the paint update.
+        """
+        painter = QPainter(self)
+        painter.fillRect(event.rect(), self._background_brush)
+        if self.num_of_paths == 0:
+            return
+
+        if self._resizing and self._last_scaled and self._last_scaled[0] == self._shown_image:
+            # Stretch the last scaled copy to the new size until the smooth rescale runs
+            pixmap = self._last_scaled[1]
+            target_size = pixmap.size().scaled(self.size(), Qt.AspectRatioMode.KeepAspectRatio)
+            painter.setRenderHint(QPainter.SmoothPixmapTransform)
+            painter.drawPixmap(QRect((self.width() - target_size.width()) // 2, (self.height() - target_size.height()) // 2, target_size.width(), target_size.height()), pixmap)
+            return
+
+        if self._resizing:
+            pixmap = self._get_scaled(self._shown_image, self.size(), Qt.TransformationMode.FastTransformation)
+        else:
+            pixmap = self._get_scaled(self._shown_image, self.size())
+            self._last_scaled = (self._shown_image, pixmap) if pixmap else None
+        if pixmap:
+            painter.drawPixmap((self.width() - pixmap.width()) // 2, (self.height() - pixmap.height()) // 2, pixmap)
 
     def resizeEvent(self, event):
-        """!@brief Handles widget resizing and scales the image accordingly.
+        """!@brief Handles widget resizing by stretching the last scaled image until the widget stops being resized.
         @param event QResizeEvent triggered when the widget is resized.
         """
         super().resizeEvent(event)
-        self.label.setGeometry(self.rect())  # Make the label fill the entire widget
 
-        # Resize the pixmap to fit the label while maintaining the aspect ratio
-        if self.label.pixmap():
-            self.label.setPixmap(self.label.pixmap().scaled(self.label.size(),Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation))
+        # The first resize happens when the widget is shown, the image is scaled smoothly straight away for that one
+        if event.oldSize().isValid():
+            self._resizing = True
+            self._resample_timer.start()
+
+    def _resample_smooth(self):
+        """!@brief Smoothly rescale the current image once the widget has not been resized for a short time."""
+        self._resizing = False
+        if self.num_of_paths > 0:
+            self._get_scaled(self._shown_image, self.size())
+        self.update()
+
+    def _get_scaled(self, i, size, transformation=Qt.TransformationMode.SmoothTransformation):
+        """!@brief Get a copy of an image scaled to fit a size while maintaining the aspect ratio.
+
+        Smoothly scaled copies are kept in a small least recently used cache so an image is only rescaled
+        the first time it is shown at a size, not every time it comes around again.
+        Fast scaled copies are only used while resizing and are not cached.
+
+        @param i The index of the image in png_paths.
+        @param size The QSize the image has to fit in.
+        @param transformation The Qt.TransformationMode to scale with.
+        @return The scaled QPixmap, or None if the image's path was empty.
+        """
+        key = (i, size.width(), size.height())
+        pixmap = self._scaled_cache.get(key)
+        if pixmap is not None:
+            self._scaled_cache.move_to_end(key)
+            return pixmap
+
+        source = self._get_source(i)
+        if source is None or source.isNull():
+            return None
+        if source.size() == size:
+            pixmap = source  # Already exactly the right size, cached so it isn't reloaded when not preloaded
+        else:
+            pixmap = source.scaled(size, Qt.AspectRatioMode.KeepAspectRatio, transformation)
+            if transformation != Qt.TransformationMode.SmoothTransformation:
+                return pixmap
+        self._scaled_cache[key] = pixmap
+        if len(self._scaled_cache) > self._scaled_cache_max:
+            self._scaled_cache.popitem(last=False)
+        return pixmap
+
+    def _get_source(self, i):
+        """!@brief Get the full size pixmap of an image, from memory if it has been loaded or else from disk.
+        @param i The index of the image in png_paths.
+        @return The QPixmap, or None if the image's path was empty.
+        """
+        source = self._source_pixmaps[i]
+        if source is None:
+            path = self.png_paths[i]
+            if not path:
+                return None
+            source = QPixmap(path)
+            if self._preload:
+                self._source_pixmaps[i] = source  # The background decode hasn't finished, keep this copy instead
+        return source
+
+    def _on_decoded(self, i, image):
+        """!@brief Store an image decoded in the background as the image's pixmap.
+        @param i The index of the image in png_paths.
+        @param image The decoded QImage.
+        """
+        if self._source_pixmaps[i] is None:
+            self._source_pixmaps[i] = QPixmap.fromImage(image)
 
 
     def change_image(self):
         """!@brief Advances to the next image in the list and updates the display.
         
         This method is called automatically by a timer. It cycles through the image list
-        and applies scaling to fit the widget's dimensions.
+        and repaints the widget, reusing the cached copy of the next image scaled to the widget's dimensions.
         """
+        if self.num_of_paths < 2:
+            return  # With one image (or none) there is nothing to change or repaint
         next_image = (self.current_path + 1) % self.num_of_paths
-        new_pixmap = self.png_paths[next_image]
-        self.current_path += 1
+        self.current_path = next_image
         if self.png_paths[next_image]:
-            pixmap = QPixmap(self.png_paths[next_image])
-            self.label.setPixmap(pixmap)
-            self.label.setScaledContents(True)
-
-        if self.label.pixmap():
-            self.label.setPixmap(self.label.pixmap().scaled(self.label.size(),Qt.AspectRatioMode.KeepAspectRatio,Qt.TransformationMode.SmoothTransformation))
+            self._shown_image = next_image
+            self.update()
 
 
 
@@ -721,12 +1411,13 @@ class Variable_Section(QWidget):
         @param parent The parent widget (optional).
         """
         super().__init__(parent)
-        self.setStyleSheet("background-color: black;")
+        # Opaque widget, paintEvent fills the black background
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        self._background_brush = QBrush(_BLACK)
 
         # FONT: "Baja"
-        font_id = QFontDatabase.addApplicationFont("Fonts/Baja.ttf")
-        if font_id < 0: print("ERROR")
-        font_families = QFontDatabase.applicationFontFamilies(font_id)
+        _load_baja()
 
 
         self.widget_types = ["Startup", "Competition", "Rear Steer", "Two-Step", "Lap Time"]
@@ -737,42 +1428,115 @@ class Variable_Section(QWidget):
         # Vars for 2 step function
         self.new_two_step_bounds = [0,0]
         self.two_step_digit_list = ["first_digit", "second_digit", "third_digit", "forth_digit", "rmp_digit"]
-        self.selected_two_step_digit = "first_digit"
+        self._sel_idx = 0  # Index of the selected digit in two_step_digit_list, 4 is the RPM label
         self.two_step_bound = "Upper"
         self.two_step_current_digit_values = [0,0,0,0]
+        self._two_step_value = 0  # The four digits as one number, kept up to date as the digits change
         self.two_step_value_up = True
         self.two_step_bad_input = False
 
+        # Cached Two-Step background, title and RPM label, redrawn when the size, scale, bound or bad input flag changes
+        self._two_step_cache = None
+        self._two_step_cache_key = None
+
+        # Pens, brushes and fonts reused on every paint, the fonts and selection pen are sized in resizeEvent
+        self._pen_text = QPen(_WHITE)
+        self._pen_black_thick = QPen(_BLACK, 15)
+        self._pen_select = QPen(_BLACK)
+        self._brush_grey = QBrush(_LIGHT_GREY)
+        self._brush_white = QBrush(_WHITE)
+        self._startup_font = QFont("Sans Serif")
+        self._error_font = QFont("Sans Serif")
+        self._title_font = QFont("Sans Serif")
+        self._bad_input_font = QFont("Sans Serif")
+        self._rpm_font = QFont(_BAJA_FAMILY)
+        self._digit_font = QFont(_BAJA_FAMILY)
+        for font in (self._startup_font, self._error_font, self._title_font, self._bad_input_font, self._rpm_font, self._digit_font):
+            font.setBold(True)
+
+        # Two-Step labels that never change, laid out once with their fonts in resizeEvent
+        self._rpm_static = QStaticText("RPM")
+        self._title_upper = QStaticText("Upper 2-Step Bound")
+        self._title_lower = QStaticText("Lower 2-Step Bound")
+        self._title_bad = QStaticText("BAD BOUNDS REOPEN FROM MENU")
+        for static_text in (self._rpm_static, self._title_upper, self._title_lower, self._title_bad):
+            static_text.setPerformanceHint(QStaticText.AggressiveCaching)
+
+    @property
+    def selected_two_step_digit(self):
+        """!@brief The name of the selected two-step digit from two_step_digit_list."""
+        return self.two_step_digit_list[self._sel_idx]
+
+    @selected_two_step_digit.setter
+    def selected_two_step_digit(self, digit):
+        """!@brief Select a two-step digit by name.
+        @param digit The name of the digit to select, must be in two_step_digit_list.
+        """
+        self._sel_idx = self.two_step_digit_list.index(digit)
+        self.update()  # Request a redraw
+
     def change_widget(self, new_widget):
         """!@brief Changes the variable section to the new widget that is passed to it and redraws the new widget.
         @param new_widget The new widget to be displayed.
         """
+        # Nothing changes if the widget is already shown (Two-Step still restarts its inputs)
+        if new_widget == self.current_widget and new_widget != "Two-Step":
+            return
+
         self.current_widget = new_widget
 
         # Default vars used for 2 step
         if new_widget == "Two-Step":
             self.new_two_step_bounds = [0,0]
-            self.selected_two_step_digit = "first_digit"
+            self._sel_idx = 0
             self.two_step_bound = "Upper"
             self.two_step_current_digit_values = [0,0,0,0]
+            self._two_step_value = 0
             self.two_step_value_up = True
             self.two_step_bad_input = False
 
         self.update()  # Request a redraw
 
+    def resizeEvent(self, event):
+        """!@brief Handle resize events by recomputing the fonts, pen width and rectangles used by the sub-widgets.
+        @param event The resize event.
+        """
+        super().resizeEvent(event)
+
+        width = self.width()
+        height = self.height()
+        self.size_factor = min(width, height) / 2 * 0.8
+
+        # Fonts are given whole point sizes (at least 1 so a tiny widget still has a valid font)
+        self._startup_font.setPointSize(max(1, int(self.size_factor/13)))
+        self._error_font.setPointSize(max(1, int(self.size_factor/12)))
+        self._title_font.setPointSize(max(1, int(self.size_factor*.15)))
+        self._bad_input_font.setPointSize(max(1, int(self.size_factor*.1)))
+        self._rpm_font.setPointSize(max(1, int(self.size_factor*.2)))
+        self._digit_font.setPointSize(max(1, int(self.size_factor*.4)))
+        self._pen_select.setWidthF(self.size_factor*.05)
+
+        self._rpm_static.prepare(QTransform(), self._rpm_font)
+        self._title_upper.prepare(QTransform(), self._title_font)
+        self._title_lower.prepare(QTransform(), self._title_font)
+        self._title_bad.prepare(QTransform(), self._bad_input_font)
+
+        # Rectangles are rounded to whole pixels
+        self._half_h = int(self.size_factor*.5)  # Height of the title bar
+        digit_width = int(width/5)
+        self._widget_rect = QRect(0, 0, width, height)
+        self._title_rect = QRect(0, 0, width, self._half_h)
+        self._digits_area_rect = QRect(0, self._half_h, width, height - self._half_h)
+        # First to forth digit then the RPM label
+        self._digit_rects = [QRect(int(width/5*i), self._half_h, digit_width, height - self._half_h) for i in range(5)]
+
     def paintEvent(self, event):
         """!@brief Paint event handler that calls the function that the variable widget is set to by its current state.
         @param event The QPaintEvent that triggered the paint update.
         """
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
-        
-        width = self.width()
-        height = self.height()
-        center_x = width / 2
-        center_y = height / 2
-        self.size_factor = min(width, height) / 2 * 0.8
-        
+        painter.fillRect(event.rect(), self._background_brush)
         
         if (self.current_widget == "Startup"):
             self.draw_Startup(painter)
@@ -801,23 +1565,10 @@ class Variable_Section(QWidget):
         It sets the pen and font style, defines the drawing rectangle, and renders a multiline instructional
         string aligned to the top-left of the widget using word wrapping.
         """
-        painter.setPen(QPen(QColor(255, 255, 255)))
-        Font = QFont("Sans Sariff", self.size_factor/13, QFont.Bold)
-        painter.setFont(Font)
+        painter.setPen(self._pen_text)
+        painter.setFont(self._startup_font)
         
-        widget_rect = QRect(0, 0, self.width(), self.height())
-        startup_string = f"""HID Control Manual: 
-    The center button will pull up a menu in the bottom of the dash that can be navigated using the left and right buttons. 
-    When the option you want is in the center slot of the 3 shown press the middle/select button to change the variable section (this one).
-    For the Two-step controls use the top and bottom buttons to increment or decrement the highlighted digit and use left and right to select another digit.
-    After the values are set correctly press the middle button to set the values and ... (Return to competition widget?)
-        
-Switch Control Manual:
-    Open: Green
-    Semi: Blue
-    Locked: Red
-"""
-        painter.drawText(widget_rect, Qt.TextWordWrap | Qt.AlignLeft | Qt.AlignTop, startup_string)
+        painter.drawText(self._widget_rect, Qt.TextWordWrap | Qt.AlignLeft | Qt.AlignTop, _STARTUP_TEXT)
 
     #TODO
     def draw_Competition(self, painter):
@@ -846,83 +1597,69 @@ Switch Control Manual:
         both the upper or lower RPM limits using four editable digits. A title is displayed to indicate
         the bound currently being edited, and if bad input was previously received, an error message is shown instead.
         Each digit is visually represented, with one digit highlighted to indicate the current selection.
+        The background, title and RPM label are drawn from a cached pixmap that is only redrawn when they change.
         """
-        # Background Color
-        painter.setPen(QPen(QColor(255, 255, 255), 15))
-        widget_rect = QRect(0, 0, self.width(), self.height())
-        painter.fillRect(widget_rect, QBrush(QColor(200, 200, 200)))
+        key = (self.width(), self.height(), self.devicePixelRatioF(), self.two_step_bound, self.two_step_bad_input)
+        if self._two_step_cache_key != key:
+            self._build_two_step_cache()
+            self._two_step_cache_key = key
+        painter.drawPixmap(0, 0, self._two_step_cache)
+
+        # Draw the indicator for which digit is being edited/changed
+        painter.setPen(self._pen_select)
+        painter.drawRect(self._digit_rects[self._sel_idx])
 
-        widget_rect = QRect(0, self.size_factor*.5, self.width(), self.height()-self.size_factor*.5)
-        painter.fillRect(widget_rect, QBrush(QColor(255, 255, 255)))
+        # Draw the current digits for the bounds
+        painter.setFont(self._digit_font)
+        for digit_rect, digit_value in zip(self._digit_rects, self.two_step_current_digit_values):
+            painter.drawText(digit_rect, _DIGITS[digit_value], Qt.AlignCenter)
+
+    def _build_two_step_cache(self):
+        """!@brief Draw the parts of the Two-Step interface that don't change with the digits into a cached pixmap.
+
+        This is the background, the title (or the bad input message) and the RPM label.
+        """
+        # Drawn at device resolution so it stays sharp on scaled displays
+        dpr = self.devicePixelRatioF()
+        self._two_step_cache = QPixmap(self.size() * dpr)
+        self._two_step_cache.setDevicePixelRatio(dpr)
+        painter = QPainter(self._two_step_cache)
+        painter.setRenderHint(QPainter.Antialiasing)
+
+        # Background Color
+        painter.fillRect(self._widget_rect, self._brush_grey)
+        painter.fillRect(self._digits_area_rect, self._brush_white)
 
         # Title
-        painter.setPen(QPen(QColor(0, 0, 0), 15))
+        painter.setPen(self._pen_black_thick)
 
         #CHECK IF BAD INPUT WAS PUT IN LAST
         if self.two_step_bad_input:
-            Font = QFont("Sans Sariff", self.size_factor*.1, QFont.Bold)
-            painter.setFont(Font)
-            painter.drawText(QRect(0, 0, self.width(), self.size_factor*.5), "BAD BOUNDS REOPEN FROM MENU", Qt.AlignCenter)
+            painter.setFont(self._bad_input_font)
+            self._draw_static_centered(painter, self._title_rect, self._title_bad)
         else:
-            Font = QFont("Sans Sariff", self.size_factor*.15, QFont.Bold)
-            painter.setFont(Font)
+            painter.setFont(self._title_font)
             if self.two_step_bound == "Upper":
-                painter.drawText(QRect(0, 0, self.width(), self.size_factor*.5), "Upper 2-Step Bound", Qt.AlignCenter)
+                self._draw_static_centered(painter, self._title_rect, self._title_upper)
             elif self.two_step_bound == "Lower":
-                painter.drawText(QRect(0, 0, self.width(), self.size_factor*.5), "Lower 2-Step Bound", Qt.AlignCenter)
+                self._draw_static_centered(painter, self._title_rect, self._title_lower)
             else:
                 print("ERROR BAD 2 Step Bound")
 
-        # 1st digit
-        first_digit_rect = QRect(0, self.size_factor*.5, self.width()/5, self.height()-self.size_factor*.5)
-        # painter.fillRect(widget_rect, QBrush(QColor(0, 255, 255)))
-        
-
-        # 2nd digit
-        second_digit_rect = QRect(self.width()/5, self.size_factor*.5, self.width()/5, self.height()-self.size_factor*.5)
-        # painter.fillRect(widget_rect, QBrush(QColor(255, 0, 255)))
-
-        # 3rd digit
-        third_digit_rect = QRect(self.width()/5*2, self.size_factor*.5, self.width()/5, self.height()-self.size_factor*.5)
-        # painter.fillRect(widget_rect, QBrush(QColor(255, 255, 0)))
-
-        # 4th digit
-        forth_digit_rect = QRect(self.width()/5*3, self.size_factor*.5, self.width()/5, self.height()-self.size_factor*.5)
-        # painter.fillRect(widget_rect, QBrush(QColor(0, 0, 255)))
-
         # RPM label
-        rmp_digit_rect = QRect(self.width()/5*4, self.size_factor*.5, self.width()/5, self.height()-self.size_factor*.5)
-        painter.setPen(QPen(QColor(0, 0, 0), 15))
-        Font = QFont("Baja", self.size_factor*.2, QFont.Bold)
-        painter.setFont(Font)
-        painter.drawText(rmp_digit_rect, "RPM", Qt.AlignCenter)
-
-
-        # Draw the indicator for which digit is being edited/changed
-        painter.setPen(QPen(QColor(0, 0, 0), self.size_factor*.05))
-
-        match (self.selected_two_step_digit):
-            case "first_digit":
-                painter.drawRect(first_digit_rect)
-            case "second_digit":
-                painter.drawRect(second_digit_rect)
-            case "third_digit":
-                painter.drawRect(third_digit_rect)
-            case "forth_digit":
-                painter.drawRect(forth_digit_rect)
-            case "rmp_digit":
-                painter.drawRect(rmp_digit_rect)
-            case _:
-                print("BAD INDEX ON 2 STEP SELECTOR")
-
-        # Draw the current digits for the bounds
-        Font = QFont("Baja", self.size_factor*.4, QFont.Bold)
-        painter.setFont(Font)
-
-        painter.drawText(first_digit_rect, str(self.two_step_current_digit_values[0]), Qt.AlignCenter)
-        painter.drawText(second_digit_rect, str(self.two_step_current_digit_values[1]), Qt.AlignCenter)
-        painter.drawText(third_digit_rect, str(self.two_step_current_digit_values[2]), Qt.AlignCenter)
-        painter.drawText(forth_digit_rect, str(self.two_step_current_digit_values[3]), Qt.AlignCenter)
+        painter.setFont(self._rpm_font)
+        self._draw_static_centered(painter, self._digit_rects[4], self._rpm_static)
+        painter.end()
+
+    def _draw_static_centered(self, painter, rect, static_text):
+        """!@brief Draw a prepared QStaticText centered in a rectangle.
+        @param painter QPainter object used to render the text, its font must be the one the text was prepared with.
+        @param rect The QRect to center the text in.
+        @param static_text The QStaticText to draw.
+        """
+        center = QRectF(rect).center()
+        text_size = static_text.size()
+        painter.drawStaticText(QPointF(center.x() - text_size.width()/2, center.y() - text_size.height()/2), static_text)
 
 
 
@@ -934,27 +1671,15 @@ Switch Control Manual:
         depending on which digit is currently selected. Each digit is constrained between 0-9 by modding by 10.
         The function then requests a repaint of the widget to reflect the updated value.
         """
-        match (self.selected_two_step_digit):
-            case "first_digit":
-                # inc or dec the self.two_step_current_digit_values[0] value by 1 then % 10
-                self.two_step_current_digit_values[0] = (self.two_step_current_digit_values[0] + value) % 10
-
-            case "second_digit":
-                # inc or dec the self.two_step_current_digit_values[1] value by 1 then % 10
-                self.two_step_current_digit_values[1] = (self.two_step_current_digit_values[1] + value) % 10
-
-            case "third_digit":
-                # inc or dec the self.two_step_current_digit_values[2] value by 1 then % 10
-                self.two_step_current_digit_values[2] = (self.two_step_current_digit_values[2] + value) % 10
+        digit = self._sel_idx
+        if digit == 4:
+            return  # The RPM label has no value so there is nothing to redraw
 
-            case "forth_digit":
-                # inc or dec the self.two_step_current_digit_values[3] value by 1 then % 10
-                self.two_step_current_digit_values[3] = (self.two_step_current_digit_values[3] + value) % 10
-
-            case "rmp_digit":
-                None
-            case _:
-                print("BAD INDEX ON 2 STEP SELECTOR")
+        # inc or dec the selected digit value by 1 then % 10 and move the whole value by the same change at that digit's place
+        old_digit = self.two_step_current_digit_values[digit]
+        new_digit = (old_digit + value) % 10
+        self.two_step_current_digit_values[digit] = new_digit
+        self._two_step_value += (new_digit - old_digit) * 10**(3 - digit)
 
         self.update()
 
@@ -971,16 +1696,17 @@ Switch Control Manual:
         Always triggers a repaint of the widget to reflect current state.
         """
         # if it is at the RPM digit
-        if self.selected_two_step_digit == "rmp_digit":
+        if self._sel_idx == 4:
                 # Update the self.two_step_bound to "Lower" if it is "Upper" or send the values over canbus if it is already "Lower"
                 if self.two_step_bound == "Upper":
-                    self.new_two_step_bounds[0] = self.two_step_current_digit_values[0]*1000 + self.two_step_current_digit_values[1]*100 + self.two_step_current_digit_values[2]*10 + self.two_step_current_digit_values[3]
+                    self.new_two_step_bounds[0] = self._two_step_value
                     self.two_step_bound = "Lower"
                     self.two_step_current_digit_values = [0,0,0,0]
-                    self.selected_two_step_digit = "first_digit"
+                    self._two_step_value = 0
+                    self._sel_idx = 0
 
                 elif self.two_step_bound == "Lower":
-                    self.new_two_step_bounds[1] = self.two_step_current_digit_values[0]*1000 + self.two_step_current_digit_values[1]*100 + self.two_step_current_digit_values[2]*10 + self.two_step_current_digit_values[3]
+                    self.new_two_step_bounds[1] = self._two_step_value
                     
                     if self.new_two_step_bounds[1] >= self.new_two_step_bounds[0]:
                         self.two_step_bad_input = True
@@ -993,7 +1719,7 @@ Switch Control Manual:
                     print("ERROR BAD self.two_step_bound")
             
         else:
-            self.selected_two_step_digit = self.two_step_digit_list[self.two_step_digit_list.index(self.selected_two_step_digit) + 1]
+            self._sel_idx += 1
 
         self.update()
 
@@ -1012,13 +1738,9 @@ Switch Control Manual:
 
         This function only occurs when the widget selected doesn't have a draw function for it.
         """
-        painter.setPen(QPen(QColor(255, 255, 255)))
-        Font = QFont("Sans Sariff", self.size_factor/12, QFont.Bold)
-        painter.setFont(Font)
+        painter.setPen(self._pen_text)
+        painter.setFont(self._error_font)
         
-        widget_rect = QRect(0, 0, self.width(), self.height())
-        error_string = f"ERROR WITH VARIABLE WIDGET. PLEASE HELP! :("
-
-        painter.drawText(widget_rect, Qt.TextWordWrap | Qt.AlignLeft | Qt.AlignTop, error_string)
+        painter.drawText(self._widget_rect, Qt.TextWordWrap | Qt.AlignLeft | Qt.AlignTop, _ERROR_TEXT)
 
 